@@ -107,12 +107,24 @@ print(recording_prb.get_channel_locations())
 
 ##############################################################################
 # Using the :code:`toolkit`, you can perform pre-processing on the recordings. Each pre-processing function also returns
-# a :code:`RecordingExtractor`, which makes it easy to build pipelines. Here, we filter the recording and apply common
-# median reference (CMR)
+# a :code:`RecordingExtractor`, which makes it easy to build pipelines. Here, we filter the recording with a Butterworth
+# filter and apply common median reference (CMR). Note that the Butterworth filter has a different frequency response
+# than the default FFT-based filter (:code:`type='fft'`), so the sorting results below may differ slightly from the ones
+# obtained with the default filter.
 
-recording_f = st.preprocessing.bandpass_filter(recording, freq_min=300, freq_max=6000)
+recording_f = st.preprocessing.bandpass_filter(recording, freq_min=300, freq_max=6000, type='butter', order=3)
 recording_cmr = st.preprocessing.common_reference(recording_f, reference='median')
 
+##############################################################################
+# Pre-processing is performed lazily: the traces are filtered and re-referenced every time :code:`get_traces()` is
+# called. Since :code:`recording_cmr` is used by several sorters and validation metrics below, we can compute the
+# pre-processed traces once and keep them in memory with a :code:`NumpyRecordingExtractor`:
+
+import numpy as np
+
+recording_cmr = se.NumpyRecordingExtractor(timeseries=recording_cmr.get_traces().astype('float32'),
+                                           geom=np.array(recording.get_channel_locations()), sampling_frequency=fs)
+
 ##############################################################################
 # Now you are ready to spikesort using the :code:`sorters` module!
 # Let's first check which sorters are implemented and which are installed
@@ -149,6 +161,37 @@ sorting_MS4_2 = ss.run_mountainsort4(recording=recording, **ms4_params)
 
 sorting_KL = ss.run_klusta(recording=recording_cmr)
 
+##############################################################################
+# Several sorters can also be launched at once with :code:`run_sorters`. Since the sorter runs are independent from
+# each other, they can be run in parallel in separate processes with :code:`engine='multiprocessing'`, and each sorter
+# writes to its own sub-folder of :code:`working_folder`.
+# On platforms that start new processes with 'spawn' (Windows and macOS), each worker re-imports the main script and
+# runs all of its top-level code, so the whole script body has to be inside a :code:`main()` function called under
+# :code:`if __name__ == '__main__':`. As a standalone script:
+#
+# .. code-block:: python
+#
+#     import spikeinterface.extractors as se
+#     import spikeinterface.sorters as ss
+#
+#
+#     def main():
+#         recording, sorting_true = se.example_datasets.toy_example(duration=10, num_channels=4, seed=0)
+#
+#         sorting_outputs = ss.run_sorters(['mountainsort4', 'klusta'], {'toy': recording},
+#                                          working_folder='sorters_output', mode='overwrite',
+#                                          engine='multiprocessing')
+#
+#         for (rec, sorter), sort in sorting_outputs.items():
+#             print(rec, sorter, ':', sort.get_unit_ids())
+#
+#
+#     if __name__ == '__main__':
+#         main()
+#
+# Failed sorter runs are logged in the working folder and are not included in :code:`sorting_outputs`, so check that
+# the expected (recording, sorter) keys are present before using them.
+
 ##############################################################################
 # The :code:`sorting_MS4` and :code:`sorting_MS4` are :code:`SortingExtractor` objects. We can print the units found using:
 